@@ -0,0 +1,53 @@
+"""
+One shared Anthropic client for all the step files.
+
+Creating a client isn't free: it sets up an HTTP connection pool, and
+the first request has to open a secure (TLS) connection to the API.
+If we make ONE client and reuse it, later requests can reuse that
+already-open connection instead of starting over.
+
+Usage:
+    from _client import get_client
+    client = get_client()
+
+    # Or, for async code (see step3_async.py):
+    from _client import get_async_client
+    client = get_async_client()
+"""
+
+import importlib.util
+
+import anthropic
+import httpx  # Installed together with anthropic
+
+# HTTP/2 lets many requests share one connection.
+# It needs the optional "h2" package (pip install "httpx[http2]").
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Keep idle connections open for a minute, so one is still ready after
+# the user spends a while typing their next message
+_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+
+_client = None
+_async_client = None
+
+
+def get_client():
+    """Return the shared client, creating it the first time it's needed."""
+    global _client
+    if _client is None:
+        # Automatically uses ANTHROPIC_API_KEY environment variable
+        _client = anthropic.Anthropic(
+            http_client=anthropic.DefaultHttpxClient(http2=_HTTP2, limits=_LIMITS)
+        )
+    return _client
+
+
+def get_async_client():
+    """Same as get_client(), but for async code (await client.messages...)."""
+    global _async_client
+    if _async_client is None:
+        _async_client = anthropic.AsyncAnthropic(
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=_HTTP2, limits=_LIMITS)
+        )
+    return _async_client
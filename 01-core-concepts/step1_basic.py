@@ -3,11 +3,12 @@ Step 1: The simplest possible version.
 Just call the API and print what Claude says.
 """
 
-import anthropic
+from _client import get_client
 
 # Your API key - set ANTHROPIC_API_KEY environment variable
 # (We'll learn better ways to handle this in Module 3)
-client = anthropic.Anthropic()  # Automatically uses ANTHROPIC_API_KEY env var
+# get_client() makes an anthropic.Anthropic() client once and reuses it
+client = get_client()  # Automatically uses ANTHROPIC_API_KEY env var
 
 # The task we want help with
 task = "Build a simple todo app"
@@ -3,10 +3,11 @@ Step 2: Add user input.
 Now the user can type their own task.
 """
 
-import anthropic
+from _client import get_client
 
 # Automatically uses ANTHROPIC_API_KEY environment variable
-client = anthropic.Anthropic()
+# get_client() makes an anthropic.Anthropic() client once and reuses it
+client = get_client()
 
 # NEW: Ask the user what they want to plan
 task = input("What do you want to plan? ")
@@ -0,0 +1,123 @@
+"""
+Step 3c: The same conversation, written with async/await.
+
+In step3_conversation.py things happen strictly one after another:
+the user types, THEN we call the API, the user types, THEN we call...
+While the user is typing, the connection to the API just sits there -
+and if it's been closed, the next call has to open it again first.
+
+With asyncio we can do two things at once: while the user is typing,
+we send a tiny "warm-up" request so the connection is open and ready
+by the time they press Enter.
+
+Run with:
+    python step3_async.py
+"""
+
+import asyncio
+
+import anthropic
+
+from _client import get_async_client
+
+
+def with_cache_breakpoint(messages):
+    """Copy the history, marking the last message for prompt caching."""
+    *history, last = messages
+    return history + [{
+        "role": last["role"],
+        "content": [{
+            "type": "text",
+            "text": last["content"],
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }]
+
+
+async def warm_up(client):
+    """Make a tiny, free request so the connection is open before we need it."""
+    try:
+        await client.models.list(limit=1)
+    except anthropic.APIError:
+        pass  # Only a warm-up - if it fails, the real request will report it
+
+
+async def ask(prompt):
+    """Like input(), but lets other work run while we wait for the user."""
+    return await asyncio.to_thread(input, prompt)
+
+
+async def main():
+    # Automatically uses ANTHROPIC_API_KEY environment variable
+    client = get_async_client()
+    messages = []
+
+    # Start warming up, then ask for the task - both happen at the same time
+    warm_up_task = asyncio.create_task(warm_up(client))
+    task = await ask("What do you want to plan? ")
+
+    messages.append({
+        "role": "user",
+        "content": f"I want to plan: {task}. Ask me ONE clarifying question."
+    })
+
+    for round in range(3):
+        print(f"\n--- Round {round + 1} ---")
+
+        # await = "wait here for the reply, but let other tasks keep running"
+        response = await client.messages.create(
+            model="claude-sonnet-4-5-20250929",
+            max_tokens=1024,
+            messages=with_cache_breakpoint(messages)
+        )
+
+        claude_says = response.content[0].text
+        print(f"\nClaude: {claude_says}")
+
+        messages.append({
+            "role": "assistant",
+            "content": claude_says
+        })
+
+        if round < 2:  # Don't ask on the last round
+            # Keep the connection warm while the user types their answer.
+            # Await the last warm-up first (it's long done by now): a task
+            # nobody awaits can vanish, and any error in it would be lost.
+            await warm_up_task
+            warm_up_task = asyncio.create_task(warm_up(client))
+            user_says = await ask("\nYou: ")
+
+            messages.append({
+                "role": "user",
+                "content": user_says
+            })
+
+    await warm_up_task
+    print("\n--- Conversation complete! ---")
+    print(f"Total messages exchanged: {len(messages)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+
+# ============================================================
+# KEY CONCEPTS:
+#
+# 1. async def / await
+#    An async function can pause at each "await" and let other
+#    work run in the meantime.
+#
+# 2. asyncio.create_task(...)
+#    Starts something in the background (our warm-up request)
+#    without waiting for it to finish. Always await it later -
+#    that's where its result (or error) comes out.
+#
+# 3. asyncio.to_thread(input, ...)
+#    input() normally blocks everything. Running it in a thread
+#    lets the warm-up happen while the user types.
+#
+# 4. anthropic.AsyncAnthropic
+#    The async version of the client - same methods, but you
+#    "await" them. (Made once by get_async_client().)
+# ============================================================
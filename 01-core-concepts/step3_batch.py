@@ -0,0 +1,172 @@
+"""
+Step 3b: Run scripted conversations in bulk with the Batches API.
+
+step3_conversation.py waits for each reply before sending the next
+message. That's what you want when a human is typing - but if the
+conversations are already written down (demos, regression checks),
+waiting on each call one at a time is slow.
+
+The Message Batches API takes many requests in one go, processes them
+in the background, and costs half as much per request.
+
+Run with:
+    python step3_batch.py --script conversations.example.jsonl
+
+Each line of the script is one conversation:
+    {"id": "recipe-app", "task": "Build a recipe app", "answers": ["...", "..."]}
+
+Each id must be unique and use only letters, digits, "_" and "-" (up to
+64 characters), and there must be one answer per round after the first.
+
+KEY INSIGHT: A batch can't wait for Claude's reply mid-request, so we
+send one batch per ROUND - every conversation's next turn together.
+"""
+
+import argparse
+import json
+import re
+import time
+
+from _client import get_client
+
+MODEL = "claude-sonnet-4-5-20250929"
+ROUNDS = 3
+BATCH_SIZE = 100     # Requests per batch
+POLL_SECONDS = 10    # How often to check if a batch is done
+
+# What the Batches API accepts as a custom_id
+CUSTOM_ID = re.compile(r"[a-zA-Z0-9_-]{1,64}")
+
+# Automatically uses ANTHROPIC_API_KEY environment variable
+client = get_client()
+
+
+def load_script(path):
+    """
+    Read one conversation per line, with an empty message history.
+
+    Every line is checked BEFORE anything is sent - a mistake found after
+    a paid batch round would waste it. Raises ValueError saying which line
+    is wrong.
+    """
+    conversations = []
+    seen_ids = set()
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            where = f"{path}, line {line_number}"
+            try:
+                convo = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"{where}: not valid JSON ({error})") from None
+
+            if not isinstance(convo, dict) or not {"id", "task", "answers"} <= convo.keys():
+                raise ValueError(f'{where}: needs "id", "task" and "answers"')
+            if not isinstance(convo["id"], str) or not CUSTOM_ID.fullmatch(convo["id"]):
+                raise ValueError(
+                    f"{where}: id {convo['id']!r} must be 1-64 letters, digits, _ or -"
+                )
+            if convo["id"] in seen_ids:
+                # Replies are matched up by id, so two conversations can't share one
+                raise ValueError(f"{where}: id {convo['id']!r} is used more than once")
+            answers = convo["answers"]
+            if not isinstance(answers, list) or len(answers) < ROUNDS - 1:
+                raise ValueError(f"{where}: needs at least {ROUNDS - 1} answers")
+            if not all(isinstance(answer, str) for answer in answers):
+                raise ValueError(f"{where}: every answer must be a string")
+
+            seen_ids.add(convo["id"])
+            convo["messages"] = [{
+                "role": "user",
+                "content": f"I want to plan: {convo['task']}. Ask me ONE clarifying question."
+            }]
+            conversations.append(convo)
+    return conversations
+
+
+def run_batch(requests):
+    """
+    Send requests through the Batches API and wait for the replies.
+
+    Returns two dicts: custom_id → reply text for the requests that
+    succeeded, and custom_id → what went wrong ("errored", "expired"...)
+    for the ones that didn't.
+    """
+    # Submit every chunk first, so they're all processed at the same time
+    batch_ids = []
+    for start in range(0, len(requests), BATCH_SIZE):
+        batch = client.messages.batches.create(requests=requests[start:start + BATCH_SIZE])
+        batch_ids.append(batch.id)
+
+    replies = {}
+    failures = {}
+    for batch_id in batch_ids:
+        while client.messages.batches.retrieve(batch_id).processing_status != "ended":
+            time.sleep(POLL_SECONDS)
+
+        # Results arrive in any order - custom_id tells us which is which
+        for entry in client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                replies[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                failures[entry.custom_id] = entry.result.type
+    return replies, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run scripted conversations as batches.")
+    parser.add_argument("--script", required=True, help="JSONL file, one conversation per line")
+    args = parser.parse_args()
+
+    try:
+        conversations = load_script(args.script)
+    except (OSError, ValueError) as error:  # Can't read the file, or a bad line
+        parser.error(str(error))  # Prints the problem and exits
+    print(f"Loaded {len(conversations)} conversation(s)")
+
+    # Conversations still going - one whose request fails is stopped,
+    # rather than sending an error message back as if Claude had said it
+    active = conversations
+    for round in range(ROUNDS):
+        if not active:
+            break
+        print(f"\n--- Round {round + 1}: sending one batch ---")
+
+        requests = [
+            {
+                "custom_id": convo["id"],
+                "params": {
+                    "model": MODEL,
+                    "max_tokens": 1024,
+                    "messages": convo["messages"],  # <-- Still the WHOLE history
+                },
+            }
+            for convo in active
+        ]
+        replies, failures = run_batch(requests)
+
+        still_active = []
+        for convo in active:
+            if convo["id"] not in replies:
+                problem = failures.get(convo["id"], "missing")
+                convo["stopped"] = f"request {problem} in round {round + 1}"
+                print(f"  {convo['id']}: {convo['stopped']} - stopping this conversation")
+                continue
+            convo["messages"].append({"role": "assistant", "content": replies[convo["id"]]})
+            if round < ROUNDS - 1:  # Don't answer after the last round
+                convo["messages"].append({"role": "user", "content": convo["answers"][round]})
+            still_active.append(convo)
+        active = still_active
+
+    for convo in conversations:
+        print(f"\n=== {convo['id']} ===")
+        for message in convo["messages"]:
+            speaker = "You" if message["role"] == "user" else "Claude"
+            print(f"\n{speaker}: {message['content']}")
+        if "stopped" in convo:
+            print(f"\n(Stopped early: {convo['stopped']})")
+
+
+if __name__ == "__main__":
+    main()
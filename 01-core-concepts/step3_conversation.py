@@ -6,10 +6,31 @@ KEY INSIGHT: Claude doesn't remember previous messages automatically.
 We have to send the ENTIRE conversation history each time.
 """
 
-import anthropic
+from _client import get_client
 
 # Automatically uses ANTHROPIC_API_KEY environment variable
-client = anthropic.Anthropic()
+# get_client() makes an anthropic.Anthropic() client once and reuses it
+client = get_client()
+
+
+def with_cache_breakpoint(messages):
+    """
+    Copy the history, marking the last message for prompt caching.
+
+    Resending the whole history is expensive. With cache_control on the
+    newest message, Anthropic caches everything up to it, so next round the
+    old messages are served from the cache instead of processed again.
+    """
+    *history, last = messages
+    return history + [{
+        "role": last["role"],
+        "content": [{
+            "type": "text",
+            "text": last["content"],
+            "cache_control": {"type": "ephemeral"},
+        }],
+    }]
+
 
 # This list stores all messages in the conversation
 # We'll keep adding to it
@@ -32,9 +53,13 @@ for round in range(3):
     response = client.messages.create(
         model="claude-sonnet-4-5-20250929",
         max_tokens=1024,
-        messages=messages  # <-- ALL messages, not just the last one!
+        messages=with_cache_breakpoint(messages)  # <-- ALL messages, not just the last one!
     )
 
+    # How much of the history was read from the cache this round?
+    cached = response.usage.cache_read_input_tokens or 0
+    print(f"(Tokens read from prompt cache: {cached})")
+
     # Get Claude's response
     claude_says = response.content[0].text
     print(f"\nClaude: {claude_says}")
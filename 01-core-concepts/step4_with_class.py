@@ -7,9 +7,37 @@ WHY A CLASS?
 - Makes the code cleaner and reusable
 
 Think of a class like a "thing" that knows stuff and can do stuff.
+
+(Want to see the class grow? step4b_cached_conversation.py builds on
+this one to reuse replies and summarize long chats.)
 """
 
-import anthropic
+from dataclasses import dataclass
+
+from _client import get_client
+
+# The two roles, shared by every message. Short string constants like
+# these are stored only once by Python, however many messages use them.
+USER = "user"
+ASSISTANT = "assistant"
+
+
+@dataclass(slots=True)
+class Message:
+    """
+    One message in the history.
+
+    A dataclass is a class that just holds data - Python writes __init__
+    for us. slots=True gives it a fixed set of fields, which makes each
+    message much smaller in memory than a dict. That adds up once a
+    conversation has thousands of them.
+    """
+    role: str
+    content: str
+
+    def to_api(self):
+        """The plain dict the Anthropic API expects."""
+        return {"role": self.role, "content": self.content}
 
 
 class SimpleConversation:
@@ -20,6 +48,7 @@ class SimpleConversation:
     - The API client
     - All messages in the conversation
     - Whether we're done
+    - How many input tokens were served from Anthropic's prompt cache
     """
 
     def __init__(self):
@@ -28,11 +57,18 @@ class SimpleConversation:
 
         Example: conversation = SimpleConversation()
         """
+        # Shared client: every conversation reuses the same connection
         # Automatically uses ANTHROPIC_API_KEY environment variable
-        self.client = anthropic.Anthropic()
+        self.client = get_client()
+        self.model = "claude-sonnet-4-5-20250929"
+        self.max_tokens = 1024
         self.messages = []  # Start with empty history
         self.is_done = False
 
+        # Token counters, so we can see how well prompt caching works
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+
     def send(self, user_message):
         """
         Send a message and get Claude's response.
@@ -43,50 +79,116 @@ class SimpleConversation:
         3. Adds Claude's response to history
         4. Returns what Claude said
         """
+        return "".join(self.send_stream(user_message))
+
+    def send_stream(self, user_message):
+        """
+        Like send(), but yields Claude's reply piece by piece as it arrives.
+
+        Example:
+            for text in convo.send_stream("Hello"):
+                print(text, end="", flush=True)
+
+        You can start printing as soon as the first words arrive instead of
+        waiting for the whole reply. Read the stream to the end - the reply
+        is added to history once it's complete.
+        """
         # Add user message to history
-        self.messages.append({
-            "role": "user",
-            "content": user_message
-        })
-
-        # Call the API with full history
-        response = self.client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=1024,
-            messages=self.messages
-        )
+        self._append(USER, user_message)
 
-        # Get Claude's response
-        claude_says = response.content[0].text
+        # We keep the text pieces as they arrive and join them at the end,
+        # so there's no need to dig the text back out of a response object
+        pieces = []
+        for text in self._stream_reply():
+            pieces.append(text)
+            yield text
 
         # Add to history
-        self.messages.append({
-            "role": "assistant",
-            "content": claude_says
-        })
+        self._append(ASSISTANT, "".join(pieces))
+
+    def _append(self, role, content):
+        """Add one message to the history."""
+        self.messages.append(Message(role, content))
+
+    def _request(self):
+        """Everything we send to the API for the next reply."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "messages": self._with_cache_breakpoint(),
+        }
+
+    def _stream_reply(self):
+        """Stream Claude's reply to the history so far, using the full history."""
+        with self.client.messages.stream(**self._request()) as stream:
+            yield from stream.text_stream
+            usage = stream.current_message_snapshot.usage
+        self._count_tokens(usage)
+
+    def _count_tokens(self, usage):
+        """Remember how much of the history came from the prompt cache."""
+        self.input_tokens += (
+            usage.input_tokens
+            + (usage.cache_read_input_tokens or 0)
+            + (usage.cache_creation_input_tokens or 0)
+        )
+        self.cache_read_tokens += usage.cache_read_input_tokens or 0
 
-        return claude_says
+    def _with_cache_breakpoint(self):
+        """
+        Copy of the history with a prompt-cache breakpoint on the last message.
+
+        Every turn resends the whole history. Marking the newest message with
+        cache_control tells Anthropic to cache everything up to it, so next
+        turn the old messages are read from the cache instead of re-processed.
+        Only the copy we send gets the marker - self.messages stays simple,
+        and there is never more than one breakpoint per request. This is
+        also where our Message objects become the dicts the API expects.
+
+        (Anthropic only caches prompts above a minimum length - about 1024
+        tokens for Sonnet - so very short chats will show a 0% hit rate.)
+        """
+        *history, last = self.messages
+        return [message.to_api() for message in history] + [{
+            "role": last.role,
+            "content": [{
+                "type": "text",
+                "text": last.content,
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }]
 
     def get_message_count(self):
         """How many messages in the conversation?"""
         return len(self.messages)
 
+    def get_cache_hit_rate(self):
+        """What fraction of input tokens were read from the prompt cache?"""
+        if self.input_tokens == 0:
+            return 0.0
+        return self.cache_read_tokens / self.input_tokens
 
-# --- Using the class ---
-
-# Create a conversation (this calls __init__)
-# Uses ANTHROPIC_API_KEY environment variable automatically
-convo = SimpleConversation()
-
-# First message
-print("You: I want to build a recipe app")
-response = convo.send("I want to build a recipe app. What's one question you have?")
-print(f"Claude: {response}")
-
-# Second message
-print("\nYou: It should work on phones")
-response = convo.send("It should work on phones")
-print(f"Claude: {response}")
 
-# Check how many messages
-print(f"\n(Total messages: {convo.get_message_count()})")
+# --- Using the class ---
+# (Inside this "if", so step4b can import the class without running the demo)
+
+if __name__ == "__main__":
+    # Create a conversation (this calls __init__)
+    # Uses ANTHROPIC_API_KEY environment variable automatically
+    convo = SimpleConversation()
+
+    # First message
+    print("You: I want to build a recipe app")
+    response = convo.send("I want to build a recipe app. What's one question you have?")
+    print(f"Claude: {response}")
+
+    # Second message - streamed, so it prints as Claude writes it
+    print("\nYou: It should work on phones")
+    print("Claude: ", end="")
+    for text in convo.send_stream("It should work on phones"):
+        print(text, end="", flush=True)
+    print()
+
+    # Check how many messages
+    print(f"\n(Total messages: {convo.get_message_count()})")
+    print(f"(Prompt cache hit rate: {convo.get_cache_hit_rate():.0%})")
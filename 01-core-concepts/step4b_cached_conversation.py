@@ -0,0 +1,427 @@
+"""
+Step 4b (bonus): A conversation that remembers replies and stays short.
+
+step4_with_class.py sends every message to the API, and the history
+it resends grows every turn. This file builds on that class - a
+"subclass" - and adds three things:
+
+1. A reply cache: the same conversation again reuses the replies
+   instead of paying for them (in memory, or on disk with shelve)
+2. An optional "semantic" cache: a message worded differently but
+   meaning the same thing can reuse a reply too
+3. Compaction: once the history gets long, older messages are
+   summarized by a cheaper model and dropped
+
+Run with:
+    python step4b_cached_conversation.py
+    python step4b_cached_conversation.py --semantic   # needs numpy + sentence-transformers
+"""
+
+import hashlib
+import os
+import shelve
+import sys
+from collections import OrderedDict
+
+from step4_with_class import ASSISTANT, USER, SimpleConversation
+
+
+class LRUDict(OrderedDict):
+    """
+    A dict that forgets its least recently used entry once it's full -
+    the same idea as functools.lru_cache, for a cache we fill ourselves.
+    """
+
+    def __init__(self, max_size):
+        super().__init__()
+        self.max_size = max_size
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)  # Just used: now the last to be forgotten
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)  # Forget the least recently used
+
+
+class SemanticIndex:
+    """
+    Past user messages as embeddings, with the reply each one got.
+
+    An embedding is a list of 384 numbers describing a message's meaning,
+    so messages worded differently but meaning the same thing end up
+    close together. Needs numpy installed.
+    """
+
+    def __init__(self, path=None):
+        """Start empty, or load what was saved at path by an earlier run."""
+        import numpy as np
+
+        self.path = path
+        # Room for 64 messages to start with; add() doubles it when full.
+        # Only the first self.size rows are in use.
+        self.size = 0
+        self.embeddings = np.empty((64, 384), dtype=np.float32)
+        self.gates = np.empty(64, dtype="U32")  # Which turn each message answered
+        self.replies = []                      # Claude's reply to each message
+        if path and os.path.exists(path):
+            with np.load(path) as saved:
+                self.size = len(saved["replies"])
+                self.embeddings = saved["embeddings"]
+                self.gates = saved["gates"]
+                self.replies = saved["replies"].tolist()
+
+    def lookup(self, embedding, gate, threshold):
+        """The reply to the closest message with the same gate, if it's close enough."""
+        import numpy as np
+
+        if self.size == 0:
+            return None
+        # Embeddings are normalized, so a dot product is cosine similarity.
+        # One matrix product scores every past message at once.
+        similarities = self.embeddings[:self.size] @ embedding
+        similarities[self.gates[:self.size] != gate] = -1.0  # Other turns never match
+        best = int(np.argmax(similarities))
+        if similarities[best] > threshold:
+            return self.replies[best]
+        return None
+
+    def add(self, embedding, gate, reply):
+        """Remember a message's embedding and the reply it got."""
+        import numpy as np
+
+        if self.size == len(self.embeddings):
+            # Full: copy into arrays twice as big. Doubling means the rows
+            # are only copied now and then, not on every add.
+            capacity = max(2 * self.size, 64)
+            self.embeddings = np.resize(self.embeddings, (capacity, 384))
+            self.gates = np.resize(self.gates, capacity)
+        self.embeddings[self.size] = embedding
+        self.gates[self.size] = gate
+        self.replies.append(reply)
+        self.size += 1
+
+    def save(self):
+        """Write the index to its file (if it has one)."""
+        import numpy as np
+
+        if self.path:
+            np.savez(
+                self.path,
+                embeddings=self.embeddings[:self.size],
+                gates=self.gates[:self.size],
+                replies=np.array(self.replies, dtype=str),
+            )
+
+
+class CachedConversation(SimpleConversation):
+    """
+    A SimpleConversation that also remembers:
+    - Replies it has already received. A conversation that repeats one
+      from earlier (in this run, or an earlier run with disk_path) reuses
+      the replies instead of calling the API again.
+    - A summary of older messages, once the history gets long
+    """
+
+    # How similar (0 to 1) a reworded message must be to reuse a reply
+    SEMANTIC_THRESHOLD = 0.92
+
+    # A small, cheap model is plenty for summarizing old messages
+    SUMMARY_MODEL = "claude-haiku-4-5-20251001"
+
+    # Replies shared by every conversation that isn't given a disk_path.
+    # A class attribute is made once and shared by all instances, so a
+    # second conversation can reuse what the first one received. It keeps
+    # the most recently used replies, so it can't grow forever.
+    _memory_cache = LRUDict(max_size=1000)
+
+    # The same idea for files: one open shelf per disk_path, shared by
+    # every conversation using it (a dbm file mustn't be opened twice),
+    # and how many conversations are using it - see close()
+    _shelves = {}
+    _shelf_users = {}
+
+    # And for the semantic cache: one SemanticIndex per disk_path
+    # (None = in memory only), shared by every conversation using it
+    _semantic_indexes = {}
+    _embedder = None  # Loaded the first time a conversation needs it
+
+    def __init__(self, disk_path=None, enable_semantic_cache=False):
+        """
+        Pass disk_path to keep the reply cache in a file, so it survives
+        between runs. Use it in a "with" block, so the file is closed
+        (and everything saved) when you're done:
+
+            with CachedConversation(disk_path="replies.cache") as convo:
+                convo.send("Hello")
+
+        Pass enable_semantic_cache=True to also reuse replies for messages
+        that are worded differently but mean the same thing. This needs
+        numpy and sentence-transformers installed. With a disk_path, these
+        are saved too, next to it in disk_path + ".semantic.npz".
+        """
+        super().__init__()  # Everything SimpleConversation sets up
+
+        # Once the history is longer than this (roughly), older messages
+        # are replaced by a short summary - see _compact_history()
+        self.max_history_tokens = 4000
+        self.summary = None
+
+        # Replies we've already received, keyed by a hash of the history.
+        # shelve is a dict stored on disk; without one, use the shared dict.
+        self._disk_path = disk_path
+        if disk_path:
+            if disk_path not in self._shelves:
+                self._shelves[disk_path] = shelve.open(disk_path)
+                self._shelf_users[disk_path] = 0
+            self._shelf_users[disk_path] += 1
+            self._cache = self._shelves[disk_path]
+        else:
+            self._cache = self._memory_cache
+        self._closed = False
+
+        # Fingerprint of the whole history so far, updated one message at
+        # a time by _append() - see _cache_key()
+        self._history_key = self._cache_key("", f"{self.model}:{self.max_tokens}")
+
+        # Optional "semantic" cache, so we can find earlier messages that
+        # mean the same thing - see SemanticIndex
+        self._semantic_index = None
+        if enable_semantic_cache:
+            self._load_embedder()
+            if disk_path not in self._semantic_indexes:
+                path = f"{disk_path}.semantic.npz" if disk_path else None
+                self._semantic_indexes[disk_path] = SemanticIndex(path)
+            self._semantic_index = self._semantic_indexes[disk_path]
+        self.semantic_hits = 0  # Replies reused for a reworded message
+
+    def send_stream(self, user_message):
+        """
+        Like SimpleConversation.send_stream(), but reuses replies it has
+        already seen instead of calling the API.
+
+        If you stop reading early (or the API call fails), your message is
+        taken back out of the history too.
+        """
+        # Add user message to history
+        history_key = self._history_key  # The history before this message
+        self._append(USER, user_message)
+
+        finished = False
+        try:
+            # Seen this exact conversation before? Reuse the reply - no API call.
+            key = self._history_key
+            claude_says = self._cache.get(key)
+
+            # Or something that means the same thing?
+            embedding = None
+            if claude_says is None and self._semantic_index is not None:
+                embedding = self._embedder.encode(user_message, normalize_embeddings=True)
+                gate = self._semantic_gate()
+                claude_says = self._semantic_index.lookup(
+                    embedding, gate, self.SEMANTIC_THRESHOLD
+                )
+                if claude_says is not None:
+                    self.semantic_hits += 1
+
+            if claude_says is not None:
+                yield claude_says
+            else:
+                # Only summarize when we're about to call the API anyway
+                self._compact_history()
+
+                pieces = []
+                for text in self._stream_reply():
+                    pieces.append(text)
+                    yield text
+
+                claude_says = "".join(pieces)
+                self._cache[key] = claude_says
+                if embedding is not None:
+                    self._semantic_index.add(embedding, gate, claude_says)
+
+            # Add to history
+            self._append(ASSISTANT, claude_says)
+            finished = True
+        finally:
+            if not finished:
+                # No reply, so drop the unanswered message - otherwise the
+                # history would have two user messages in a row
+                self.messages.pop()
+                self._history_key = history_key
+
+    def _append(self, role, content):
+        """Add one message to the history (and to its fingerprint)."""
+        super()._append(role, content)
+        self._history_key = self._cache_key(self._history_key, f"{role}:{content}")
+
+    def _request(self):
+        """SimpleConversation's request, plus the summary if we have one."""
+        request = super()._request()
+        if self.summary is not None:
+            request["system"] = f"Summary of the conversation so far: {self.summary}"
+        return request
+
+    def _compact_history(self):
+        """
+        Keep the history from growing forever.
+
+        Every turn resends the whole history, so long chats get slower and
+        more expensive each round. Once we're over max_history_tokens, the
+        older messages are summarized by a cheaper model and dropped. The
+        last 2 turns (each a user message and Claude's answer) and the new
+        message stay word for word, so prompt caching still hits on them,
+        and the summary is sent as the system prompt.
+
+        The reply cache key covers the whole original history, not the
+        summary, so a summary worded differently doesn't cause cache misses.
+        """
+        # A rough rule of thumb: 1 token is about 4 characters of English
+        history_chars = sum(len(message.content) for message in self.messages)
+        if history_chars // 4 <= self.max_history_tokens:
+            return
+
+        # Where does each complete turn (user message + reply) start?
+        turn_starts = [
+            i for i, message in enumerate(self.messages[:-1])
+            if message.role == USER and self.messages[i + 1].role == ASSISTANT
+        ]
+        if len(turn_starts) < 2 or turn_starts[-2] == 0:
+            return  # Nothing older than the last 2 turns to summarize
+
+        cut = turn_starts[-2]
+        old, recent = self.messages[:cut], self.messages[cut:]
+
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in old)
+        if self.summary:
+            transcript = f"Summary of what came before: {self.summary}\n\n{transcript}"
+
+        response = self.client.messages.create(
+            model=self.SUMMARY_MODEL,
+            max_tokens=256,
+            messages=[{
+                "role": "user",
+                "content": f"Summarize this conversation in a few sentences:\n\n{transcript}"
+            }]
+        )
+        self.summary = response.content[0].text
+        self.messages = recent
+
+    @staticmethod
+    def _cache_key(previous_key, text):
+        """
+        A short fingerprint of everything that decides Claude's reply.
+
+        Each key is a hash of the previous key plus one new message, so it
+        covers the model, the settings and the whole history - but each
+        turn only hashes the newest message, not everything again.
+        Same model + same settings + same history = same key.
+        """
+        hasher = hashlib.blake2b(previous_key.encode(), digest_size=16)
+        hasher.update(text.encode())
+        return hasher.hexdigest()
+
+    @classmethod
+    def _load_embedder(cls):
+        """Load the embedding model once; every conversation shares it."""
+        if cls._embedder is None:
+            from sentence_transformers import SentenceTransformer
+
+            cls._embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+
+    def _semantic_gate(self):
+        """
+        Which turn the newest message is answering.
+
+        A reworded message only reuses a reply if it came right after the
+        same reply from Claude (or both start a conversation) - "yes" means
+        different things after different questions. Only the turn before
+        counts, not the whole history, so once one reworded message has
+        reused a reply, the next one can too.
+
+        Caveat: embeddings capture overall meaning, not exact constraints.
+        "Plan a todo app in Python" and "...in Rust" look almost identical,
+        which is why the threshold is set high.
+        """
+        previous_reply = self.messages[-2].content if len(self.messages) > 1 else ""
+        return self._cache_key(self.model, previous_reply)
+
+    def close(self):
+        """
+        Save the on-disk reply cache and semantic index (if we're using them).
+
+        The shelf is shared, so it's only closed once the last conversation
+        using it is closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._semantic_index is not None:
+            self._semantic_index.save()
+        if self._disk_path:
+            self._shelf_users[self._disk_path] -= 1
+            if self._shelf_users[self._disk_path] == 0:
+                del self._shelf_users[self._disk_path]
+                self._shelves.pop(self._disk_path).close()
+
+    # "with CachedConversation(...) as convo:" calls these two, so close()
+    # runs at the end of the block - even if something goes wrong inside it
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    semantic = "--semantic" in sys.argv
+
+    # The same conversation twice. The second one reuses every reply.
+    for attempt in (1, 2):
+        print(f"\n--- Conversation {attempt} ---")
+        with CachedConversation(enable_semantic_cache=semantic) as convo:
+            print("You: I want to build a recipe app")
+            print(f"Claude: {convo.send('I want to build a recipe app. What is one question you have?')}")
+            print(f"(Prompt cache hit rate: {convo.get_cache_hit_rate():.0%})")
+
+    if semantic:
+        # Worded differently, but it means the same thing
+        print("\n--- Conversation 3 (reworded) ---")
+        with CachedConversation(enable_semantic_cache=True) as convo:
+            print("You: I'd like to build a recipe app")
+            print(f"Claude: {convo.send('I would like to build a recipe app. What is one question you have?')}")
+        print(f"\n(Reworded message reused a reply: {convo.semantic_hits == 1})")
+
+
+if __name__ == "__main__":
+    main()
+
+
+# ============================================================
+# KEY CONCEPTS:
+#
+# 1. Subclassing: class CachedConversation(SimpleConversation)
+#    We get everything SimpleConversation does for free, and only
+#    write the parts that change. super() calls the original.
+#
+# 2. A cache key
+#    A short hash of everything that decides the reply. Same key
+#    = same reply, so we can skip the API call.
+#
+# 3. Class attributes (_memory_cache, _semantic_indexes)
+#    Shared by every instance, so one conversation can reuse
+#    what another one received.
+#
+# 4. try / finally
+#    The finally part runs however we leave the try - even after
+#    an error - so the history never ends up half-updated.
+#
+# 5. __enter__ / __exit__ (a "context manager")
+#    Lets you write "with CachedConversation(...) as convo:", so the
+#    cache file is closed for you at the end of the block.
+# ============================================================
@@ -5,6 +5,15 @@ When you're just using dictionaries, things get messy fast.
 Run this file to see what can go wrong.
 """
 
+import sys
+
+# This file prints a lot of short lines. In a terminal, Python normally
+# sends each line to the screen as soon as it's printed; turning that off
+# lets it collect the output and write it in one go at the end.
+# (Only real terminal/file output has reconfigure() - not IDLE or notebooks.)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False)
+
 # Let's say we're building a task tracker.
 # We represent tasks as dictionaries:
 
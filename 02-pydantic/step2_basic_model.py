@@ -7,8 +7,14 @@ A Pydantic model is like a dictionary, but:
 - Your editor can autocomplete fields
 """
 
+import sys
+
 from pydantic import BaseModel
 
+# Collect the printed lines and write them all at once (see step1)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False)
+
 
 # Define a "shape" for our task data
 class Task(BaseModel):
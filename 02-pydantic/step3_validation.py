@@ -8,9 +8,15 @@ Pydantic can enforce rules beyond just types:
 - Default values
 """
 
+import sys
+
 from pydantic import BaseModel, Field
 from typing import Optional
 
+# Collect the printed lines and write them all at once (see step1)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False)
+
 
 class Task(BaseModel):
     # Required field - must provide it
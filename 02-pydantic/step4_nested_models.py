@@ -12,6 +12,13 @@ Pydantic handles this naturally.
 from pydantic import BaseModel, Field
 from enum import Enum
 
+# Optional speed-up for very large lists (pip install numpy numba).
+# Everything below still works without them.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # First, let's define an Enum for priority
 # Enums are a way to define a fixed set of choices
@@ -22,6 +29,13 @@ class Priority(str, Enum):
     CRITICAL = "critical"
 
 
+# Facts about Priority that never change - work them out once, up front,
+# instead of every time we need them
+_PRIORITY_VALUES = tuple(p.value for p in Priority)      # ("low", "medium", ...)
+_PRIORITY_ORDER = tuple(Priority)                        # Index → Priority
+_PRIORITY_CODE = {p: i for i, p in enumerate(Priority)}  # Priority → index
+
+
 # A simple Task model
 class Task(BaseModel):
     title: str
@@ -29,6 +43,37 @@ class Task(BaseModel):
     done: bool = False
 
 
+# Numba can compile this loop to machine code, so it runs at C speed
+# instead of one Python step at a time
+def _count_true(flags):
+    count = 0
+    for i in range(flags.size):
+        count += flags[i]
+    return count
+
+
+# Importing numba and compiling take a while, so we only do it the first
+# time a big list is counted - not every time this file is run.
+# None = not tried yet, False = numba isn't installed.
+_compiled_count = None
+
+# Below this many tasks, plain Python is faster than copying into an array
+FAST_COUNT_MIN_TASKS = 10_000
+
+
+def _get_count_kernel():
+    """The compiled _count_true(), or None if numpy or numba are missing."""
+    global _compiled_count
+    if _compiled_count is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _compiled_count = False
+        else:
+            _compiled_count = njit(cache=True)(_count_true) if np is not None else False
+    return _compiled_count or None
+
+
 # A TaskList that CONTAINS multiple Tasks
 class TaskList(BaseModel):
     name: str = Field(description="Name of this task list")
@@ -42,6 +87,71 @@ class TaskList(BaseModel):
         """Count how many tasks are pending."""
         return sum(1 for task in self.tasks if not task.done)
 
+    def count_done_fast(self) -> int:
+        """
+        Same answer as count_done(), for lists with 10,000+ tasks.
+
+        The done flags are copied into a compact numpy array, then counted
+        by the compiled _count_true(). Falls back to count_done() for
+        smaller lists, or if numpy or numba aren't installed.
+        """
+        if len(self.tasks) < FAST_COUNT_MIN_TASKS:
+            return self.count_done()
+        kernel = _get_count_kernel()
+        if kernel is None:
+            return self.count_done()
+        flags = np.fromiter(
+            (task.done for task in self.tasks), dtype=np.bool_, count=len(self.tasks)
+        )
+        return int(kernel(flags))
+
+
+# The same data stored "by column": one list per field, instead of one
+# Task object per task. To count done tasks we only need the done flags,
+# and as a numpy array they sit side by side in memory (1 byte each)
+# instead of being scattered across thousands of separate objects.
+# This is the "rewrite the data" fix: change the layout, not the loop.
+
+class TaskListSoA(BaseModel):
+    name: str
+    titles: list[str] = Field(default_factory=list)
+    priorities: list[int] = Field(default_factory=list)
+    done_flags: list[bool] = Field(default_factory=list)
+
+    @classmethod
+    def from_aos(cls, old: TaskList) -> "TaskListSoA":
+        """Convert a regular TaskList (one object per task) into columns."""
+        return cls(
+            name=old.name,
+            titles=[task.title for task in old.tasks],
+            priorities=[_PRIORITY_CODE[task.priority] for task in old.tasks],
+            done_flags=[task.done for task in old.tasks],
+        )
+
+    def to_aos(self) -> TaskList:
+        """Convert back into a regular TaskList."""
+        return TaskList(
+            name=self.name,
+            tasks=[
+                Task(title=title, priority=_PRIORITY_ORDER[code], done=done)
+                for title, code, done in zip(self.titles, self.priorities, self.done_flags)
+            ],
+        )
+
+    def done_array(self):
+        """The done column as a numpy bool array (needs numpy)."""
+        return np.asarray(self.done_flags, dtype=np.bool_)
+
+    def priority_array(self):
+        """The priority column as a numpy int8 array (needs numpy)."""
+        return np.asarray(self.priorities, dtype=np.int8)
+
+    def count_done(self) -> int:
+        """Count done tasks with one numpy sum over the done column."""
+        if np is None:
+            return sum(self.done_flags)
+        return int(self.done_array().sum())
+
 
 print("=== Creating Nested Models ===\n")
 
@@ -59,6 +169,7 @@ my_list = TaskList(
 print(f"Task List: {my_list.name}")
 print(f"Total tasks: {len(my_list.tasks)}")
 print(f"Done: {my_list.count_done()}")
+print(f"Done (fast version): {my_list.count_done_fast()}")
 print(f"Pending: {my_list.count_pending()}")
 
 print("\nAll tasks:")
@@ -66,6 +177,11 @@ for i, task in enumerate(my_list.tasks, 1):
     status = "✓" if task.done else " "
     print(f"  {i}. [{status}] {task.title} ({task.priority.value})")
 
+# Same tasks, stored as columns
+columns = TaskListSoA.from_aos(my_list)
+print(f"\nAs columns: done_flags={columns.done_flags}")
+print(f"Done (column version): {columns.count_done()}")
+
 
 print("\n=== Why Enums? ===\n")
 
@@ -75,7 +191,7 @@ try:
     bad_task = Task(title="Test", priority="super-high")
 except Exception as e:
     print(f"  CAUGHT! 'super-high' is not a valid Priority")
-    print(f"  Valid choices: {[p.value for p in Priority]}")
+    print(f"  Valid choices: {_PRIORITY_VALUES}")
 
 
 print("\n=== Deeper Nesting ===\n")
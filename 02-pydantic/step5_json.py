@@ -10,9 +10,26 @@ Claude responds with text (often JSON). Pydantic can:
 This is EXACTLY how we handle Claude's responses in the real project!
 """
 
-from pydantic import BaseModel, Field
+import timeit
 from enum import Enum
-import json
+from typing import Literal
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+# orjson is a much faster JSON library (pip install orjson).
+# If it isn't installed, fall back to Python's built-in json module.
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    dumps = json.dumps
+    loads = json.loads
 
 
 class Priority(str, Enum):
@@ -28,11 +45,93 @@ class Task(BaseModel):
     estimated_hours: float | None = None
 
 
+# Optional speed-up for plans with many thousands of tasks
+# (pip install numpy numba). Everything still works without them.
+# Importing numba and compiling take a while, so that only happens the
+# first time a big plan is averaged - not every time this file is run.
+# None = not tried yet, False = numpy or numba isn't installed.
+_compiled_mean = None
+
+# Below this many estimates, plain Python is faster than copying into an array
+FAST_MEAN_MIN_TASKS = 10_000
+
+
+def _get_mean_kernel():
+    """A compiled mean() for numpy arrays, or None if numpy or numba are missing."""
+    global _compiled_mean
+    if _compiled_mean is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _compiled_mean = False
+        else:
+            # Numba compiles this to machine code. parallel=True + prange
+            # splits the loop across CPU cores; fastmath=True lets it add
+            # the numbers in any order.
+            @njit(parallel=True, fastmath=True, cache=True)
+            def _mean(values):
+                total = 0.0
+                for i in prange(values.size):
+                    total += values[i]
+                return total / values.size
+
+            _compiled_mean = _mean
+    return _compiled_mean or None
+
+
+# Another way to limit a field to fixed choices: Literal.
+# The value stays a plain string - no Priority object is created -
+# which makes it a good fit for decoding lots of tasks at once.
+PriorityLit = Literal["low", "medium", "high"]
+
+
+class TaskFast(BaseModel):
+    """Same fields as Task, with priority as a plain string."""
+    title: str
+    priority: PriorityLit = "medium"
+    done: bool = False
+    estimated_hours: float | None = None
+
+
 class TaskPlan(BaseModel):
     plan_name: str
     tasks: list[Task]
     total_hours: float | None = None
 
+    def to_json(self, indent: int | None = None) -> str:
+        """JSON string with only the fields that were actually set."""
+        return self.model_dump_json(indent=indent, exclude_none=True, exclude_unset=True)
+
+    def to_dict(self) -> dict:
+        """Dictionary with only the fields that were actually set."""
+        return self.model_dump(mode="python", exclude_unset=True)
+
+    def mean_hours(self) -> float | None:
+        """
+        Average estimated hours of the tasks that have an estimate.
+
+        Returns None if no task has one. For big plans it uses a compiled
+        loop when numpy and numba are installed, plain Python otherwise.
+        """
+        hours = [task.estimated_hours for task in self.tasks if task.estimated_hours is not None]
+        if not hours:
+            return None
+        kernel = _get_mean_kernel() if len(hours) >= FAST_MEAN_MIN_TASKS else None
+        if kernel is None:
+            return sum(hours) / len(hours)
+
+        import numpy as np
+
+        return float(kernel(np.array(hours, dtype=np.float64)))
+
+
+# A TypeAdapter validates/serializes any type that isn't a model - lists,
+# dicts... (Models already have model_validate_json() and friends.)
+# Building one compiles a validator, so make each one ONCE, here at the
+# top, and reuse it. (Never create a TypeAdapter inside a loop!)
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])  # For a bare JSON array of tasks
+_TASK_FAST_LIST_ADAPTER = TypeAdapter(list[TaskFast])
+
 
 print("=== Python Object → JSON ===\n")
 
@@ -48,7 +147,9 @@ my_plan = TaskPlan(
 )
 
 # Convert to JSON string
-json_string = my_plan.model_dump_json(indent=2)
+# exclude_unset skips fields we never set (like done=False defaults),
+# so there's less to serialize and the output is smaller
+json_string = my_plan.to_json(indent=2)
 print("JSON output:")
 print(json_string)
 
@@ -75,6 +176,7 @@ print(f"Parsed plan: {parsed_plan.plan_name}")
 print(f"Number of tasks: {len(parsed_plan.tasks)}")
 for task in parsed_plan.tasks:
     print(f"  - {task.title} ({task.priority.value}): {task.estimated_hours}h")
+print(f"Average estimate: {parsed_plan.mean_hours():.1f}h per task")
 
 
 print("\n=== Validation Still Works! ===\n")
@@ -101,10 +203,13 @@ except Exception as e:
 print("\n=== Converting to Dict ===\n")
 
 # Sometimes you need a dictionary instead of JSON string
-my_dict = my_plan.model_dump()
+my_dict = my_plan.to_dict()
 print(f"Type: {type(my_dict)}")
 print(f"Dict: {my_dict}")
 
+# Plain dicts don't have model_dump_json() - use a JSON library instead
+print(f"As JSON: {dumps(my_dict)}")
+
 
 print("\n=== From Dict to Object ===\n")
 
@@ -119,6 +224,39 @@ some_dict = {
 plan_from_dict = TaskPlan.model_validate(some_dict)
 print(f"Created: {plan_from_dict.plan_name} with {len(plan_from_dict.tasks)} task(s)")
 
+# Already parsed JSON into a dict (e.g. to look at it first)? Validate the dict.
+# If you only need the model, model_validate_json() is faster - one step, not two.
+raw_json = b'{"plan_name": "From Bytes", "tasks": [{"title": "Task 1"}]}'
+plan_from_bytes = TaskPlan.model_validate(loads(raw_json))
+print(f"Created: {plan_from_bytes.plan_name} with {len(plan_from_bytes.tasks)} task(s)")
+
+
+print("\n=== Not Everything Is a Model ===\n")
+
+# Sometimes Claude sends just a list. There's no model for "list of Tasks",
+# so we use the TypeAdapter we built at the top.
+json_list = '[{"title": "Read docs", "priority": "low"}, {"title": "Write code"}]'
+task_list = _TASK_LIST_ADAPTER.validate_json(json_list)
+print(f"Parsed {len(task_list)} tasks: {[task.title for task in task_list]}")
+
+
+print("\n=== Lots of Tasks at Once ===\n")
+
+# Enum or Literal? Both reject "super-urgent". With an Enum you get
+# task.priority.value; with a Literal, task.priority is already "high".
+many_tasks = dumps([
+    {"title": f"Task {i}", "priority": ("low", "medium", "high")[i % 3]}
+    for i in range(10_000)
+])
+fast_tasks = _TASK_FAST_LIST_ADAPTER.validate_json(many_tasks)
+print(f"Parsed {len(fast_tasks)} tasks, first priority: {fast_tasks[0].priority!r}")
+
+# Measure before you switch: recent Pydantic versions check str Enums
+# quickly too, so the difference may be small
+for name, adapter in [("Enum", _TASK_LIST_ADAPTER), ("Literal", _TASK_FAST_LIST_ADAPTER)]:
+    seconds = min(timeit.repeat(lambda: adapter.validate_json(many_tasks), number=5, repeat=3)) / 5
+    print(f"  {name:<8} {seconds * 1000:5.1f} ms for 10,000 tasks")
+
 
 print("\n" + "="*50)
 print("KEY METHODS:")
@@ -126,6 +264,7 @@ print("")
 print("Python Object → JSON string:")
 print("  obj.model_dump_json()      # Returns JSON string")
 print("  obj.model_dump_json(indent=2)  # Pretty-printed")
+print("  obj.model_dump_json(exclude_unset=True)  # Skip fields never set")
 print("")
 print("JSON string → Python Object:")
 print("  Model.model_validate_json(json_string)")
@@ -133,8 +272,20 @@ print("")
 print("Python Object → Dict:")
 print("  obj.model_dump()           # Returns dictionary")
 print("")
+print("Dict → JSON string (plain dicts):")
+print("  orjson.dumps(d).decode()   # Or json.dumps(d)")
+print("")
 print("Dict → Python Object:")
 print("  Model.model_validate(dict)")
+print("")
+print("Any type (e.g. list[Task]) - build the adapter once, reuse it:")
+print("  adapter = TypeAdapter(list[Task])")
+print("  adapter.validate_json(json_string)")
+print("  adapter.validate_python(data)")
+print("  adapter.dump_json(obj)")
+print("")
+print("Fixed choices without an Enum:")
+print('  priority: Literal["low", "medium", "high"]')
 print("="*50)
 print("")
 print("THIS IS HOW WE HANDLE CLAUDE'S RESPONSES!")
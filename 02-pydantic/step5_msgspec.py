@@ -0,0 +1,171 @@
+"""
+Step 5b: The Same Models with msgspec - When Speed Matters
+
+Pydantic is the right default: great errors, lots of features.
+But if your app encodes/decodes thousands of objects in a loop,
+serialization speed starts to matter.
+
+msgspec is a library built for exactly that. Its models (Structs) look
+almost the same as Pydantic models, but encoding and decoding JSON is
+much faster.
+
+Run with:
+    pip install msgspec
+    python step5_msgspec.py
+"""
+
+import timeit
+from enum import Enum
+
+import msgspec
+from pydantic import BaseModel
+
+
+# Enums work exactly as before - msgspec encodes them by value
+class Priority(str, Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+# A msgspec Struct looks just like a Pydantic model
+class Task(msgspec.Struct):
+    title: str
+    priority: Priority = Priority.MEDIUM
+    done: bool = False
+    estimated_hours: float | None = None
+
+
+class TaskPlan(msgspec.Struct):
+    plan_name: str
+    tasks: list[Task]
+    total_hours: float | None = None
+
+
+print("=== Python Object → JSON ===\n")
+
+my_plan = TaskPlan(
+    plan_name="Build a Website",
+    tasks=[
+        Task(title="Design mockups", priority=Priority.HIGH, estimated_hours=4.0),
+        Task(title="Write HTML", priority=Priority.MEDIUM, estimated_hours=2.0),
+        Task(title="Add CSS styling", priority=Priority.MEDIUM, estimated_hours=3.0),
+    ],
+    total_hours=9.0
+)
+
+# encode() returns bytes; format() pretty-prints them
+json_bytes = msgspec.json.encode(my_plan)
+print("JSON output:")
+print(msgspec.json.format(json_bytes, indent=2).decode())
+
+
+print("\n=== JSON → Python Object ===\n")
+
+json_from_claude = '''
+{
+    "plan_name": "Learn Python",
+    "tasks": [
+        {"title": "Read tutorial", "priority": "low", "estimated_hours": 1.0},
+        {"title": "Practice coding", "priority": "high", "estimated_hours": 5.0},
+        {"title": "Build a project", "priority": "high", "estimated_hours": 10.0}
+    ],
+    "total_hours": 16.0
+}
+'''
+
+# type= tells msgspec what shape to validate against
+parsed_plan = msgspec.json.decode(json_from_claude, type=TaskPlan)
+
+print(f"Parsed plan: {parsed_plan.plan_name}")
+for task in parsed_plan.tasks:
+    print(f"  - {task.title} ({task.priority.value}): {task.estimated_hours}h")
+
+
+print("\n=== Validation Still Works! ===\n")
+
+bad_json = '{"plan_name": "Bad Plan", "tasks": [{"title": "Bad task", "priority": "super-urgent"}]}'
+
+try:
+    msgspec.json.decode(bad_json, type=TaskPlan)
+except msgspec.ValidationError as e:
+    print(f"  CAUGHT! {e}")
+
+
+print("\n=== How Much Faster? ===\n")
+
+
+# The same models in Pydantic, so we can compare
+class PydanticTask(BaseModel):
+    title: str
+    priority: Priority = Priority.MEDIUM
+    done: bool = False
+    estimated_hours: float | None = None
+
+
+class PydanticTaskPlan(BaseModel):
+    plan_name: str
+    tasks: list[PydanticTask]
+    total_hours: float | None = None
+
+
+pydantic_plan = PydanticTaskPlan.model_validate_json(json_from_claude)
+decoder = msgspec.json.Decoder(TaskPlan)  # Reusable decoder, built once
+encoder = msgspec.json.Encoder()
+
+runs = 20_000
+timings = {
+    "Pydantic encode": timeit.timeit(pydantic_plan.model_dump_json, number=runs),
+    "msgspec encode": timeit.timeit(lambda: encoder.encode(parsed_plan), number=runs),
+    "Pydantic decode": timeit.timeit(
+        lambda: PydanticTaskPlan.model_validate_json(json_from_claude), number=runs
+    ),
+    "msgspec decode": timeit.timeit(lambda: decoder.decode(json_from_claude), number=runs),
+}
+
+for name, seconds in timings.items():
+    print(f"  {name:<16} {seconds / runs * 1_000_000:6.2f} µs per call")
+
+
+print("\n=== Big Text Fields ===\n")
+
+# Most of the time spent writing JSON goes into long strings: every
+# character is checked to see if it needs escaping. With big text fields
+# (long descriptions, pasted documents) that check dominates.
+# Pydantic's model_dump_json() is slowest here. Two faster options:
+#   - msgspec (above)
+#   - model_dump() to a dict, then a fast JSON library like orjson
+long_text = "Step-by-step notes for this task. " * 300  # About 10 KB
+wordy_plan = PydanticTaskPlan(
+    plan_name="Wordy Plan",
+    tasks=[PydanticTask(title=long_text) for _ in range(20)],
+)
+wordy_struct = msgspec.convert(wordy_plan.model_dump(), type=TaskPlan)
+
+runs = 500
+timings = {
+    "model_dump_json()": timeit.timeit(wordy_plan.model_dump_json, number=runs),
+    "msgspec encode": timeit.timeit(lambda: encoder.encode(wordy_struct), number=runs),
+}
+try:
+    import orjson  # pip install orjson
+
+    timings["orjson(model_dump())"] = timeit.timeit(
+        lambda: orjson.dumps(wordy_plan.model_dump()), number=runs
+    )
+except ImportError:
+    print("  (pip install orjson to include it in the comparison)")
+
+for name, seconds in timings.items():
+    print(f"  {name:<22} {seconds / runs * 1_000_000:8.1f} µs per call")
+
+
+print("\n" + "="*50)
+print("KEY CONCEPTS:")
+print("- msgspec.Struct is a faster alternative to BaseModel")
+print("- msgspec.json.encode(obj) → JSON bytes")
+print("- msgspec.json.decode(data, type=Model) → validated object")
+print("- Build a Decoder/Encoder once and reuse it in loops")
+print("- Big text fields? msgspec or orjson.dumps(obj.model_dump()) are faster")
+print("- Stick with Pydantic unless serialization is your bottleneck")
+print("="*50)
@@ -13,6 +13,8 @@ pydantic-settings combines Pydantic validation with environment variables:
 - SecretStr for API keys (won't leak in logs)
 """
 
+from functools import lru_cache
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -52,10 +54,22 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load the settings once, then hand back the same object every time.
+
+    Settings() reads the .env file and validates every field. There's no
+    need to repeat that on every call - the values don't change while the
+    program runs. (In tests, call get_settings.cache_clear() to reload.)
+    """
+    return Settings()
+
+
 print("=== Loading Settings ===\n")
 
 try:
-    settings = Settings()
+    settings = get_settings()
 
     print("Settings loaded successfully!\n")
 
@@ -70,6 +84,9 @@ try:
 
     print(f"max_tokens: {settings.max_tokens}")
     print(f"  Type: {type(settings.max_tokens)} (auto-converted from string!)")
+    print()
+
+    print(f"Same object on the next call? {get_settings() is settings}")
 
 except Exception as e:
     print(f"Error loading settings: {e}")
@@ -94,4 +111,7 @@ print("   API keys won't show in logs or error messages")
 print()
 print("5. SINGLE SOURCE OF TRUTH")
 print("   All config in one class, with documentation")
+print()
+print("6. LOAD ONCE")
+print("   get_settings() reads .env the first time, then reuses the result")
 print("="*50)
@@ -20,40 +20,65 @@ print("\n" + "="*50)
 # Let's try to parse arguments manually
 # Imagine we want: python script.py --name Alice --age 30
 
+# Each flag maps to a small "handler" function in a lookup table.
+# A handler reads what it needs from args, stores the result in state,
+# and returns the position of the next argument to look at.
+# One dictionary lookup per argument - no long if/elif chain to walk.
+
+def _value_after(args, i):
+    """The value that follows a flag, e.g. "Alice" in --name Alice."""
+    if i + 1 >= len(args):
+        print(f"Error: {args[i]} requires a value")
+        sys.exit(1)
+    return args[i + 1]
+
+
+def _take_str(key):
+    """Make a handler that stores the next argument as a string."""
+    def handler(state, args, i):
+        state[key] = _value_after(args, i)
+        return i + 2
+    return handler
+
+
+def _take_int(key):
+    """Make a handler that stores the next argument as a whole number."""
+    def handler(state, args, i):
+        try:
+            state[key] = int(_value_after(args, i))
+        except ValueError:
+            print(f"Error: {args[i]} must be a number")
+            sys.exit(1)
+        return i + 2
+    return handler
+
+
+def _show_help(state, args, i):
+    print("Usage: python step1_no_framework.py --name NAME --age AGE")
+    sys.exit(0)
+
+
+HANDLERS = {
+    "--name": _take_str("name"),
+    "--age": _take_int("age"),
+    "--help": _show_help,
+}
+
+
 def parse_args():
     """Parse --name and --age from command line."""
-    name = None
-    age = None
+    state = {"name": None, "age": None}
 
     args = sys.argv[1:]
     i = 0
     while i < len(args):
-        if args[i] == "--name":
-            if i + 1 < len(args):
-                name = args[i + 1]
-                i += 2
-            else:
-                print("Error: --name requires a value")
-                sys.exit(1)
-        elif args[i] == "--age":
-            if i + 1 < len(args):
-                try:
-                    age = int(args[i + 1])
-                except ValueError:
-                    print("Error: --age must be a number")
-                    sys.exit(1)
-                i += 2
-            else:
-                print("Error: --age requires a value")
-                sys.exit(1)
-        elif args[i] == "--help":
-            print("Usage: python step1_no_framework.py --name NAME --age AGE")
-            sys.exit(0)
-        else:
+        handler = HANDLERS.get(args[i])
+        if handler is None:
             print(f"Unknown argument: {args[i]}")
             sys.exit(1)
+        i = handler(state, args, i)
 
-    return name, age
+    return state["name"], state["age"]
 
 
 name, age = parse_args()
@@ -69,11 +94,11 @@ print("\n" + "="*50)
 print("PROBLEMS WITH MANUAL PARSING:")
 print("="*50)
 print()
-print("1. So much code just for 2 arguments!")
+print("1. So much code just for 2 arguments (even with a lookup table)!")
 print("2. No automatic --help generation")
 print("3. Type conversion is manual (int(age))")
 print("4. Error messages are inconsistent")
 print("5. No validation built-in")
-print("6. Adding new arguments = more spaghetti code")
+print("6. Every new argument = another handler you write yourself")
 print()
 print("Typer solves all of this. See step2!")
@@ -13,6 +13,7 @@ Run with:
     python step3_options.py --name Alice --loud
 """
 
+import sys
 from typing import Annotated
 import typer
 
@@ -38,8 +39,8 @@ def main(
     if loud:
         message = message.upper()
 
-    for _ in range(times):
-        print(message)
+    # Build all the lines first, then write them out in one go
+    sys.stdout.write((message + "\n") * times)
 
 
 if __name__ == "__main__":
@@ -12,45 +12,111 @@ Run with:
     python step4_multiple_commands.py --help
     python step4_multiple_commands.py greet Alice
     python step4_multiple_commands.py add 5 3
+    python step4_multiple_commands.py add 5 3 --jit
     python step4_multiple_commands.py info
 """
 
-import typer
+import sys
 
-# Create the app
-app = typer.Typer(
-    name="demo",
-    help="A demo CLI with multiple commands"
-)
+# Shown for a plain `--help`, so that doesn't have to import Typer at all.
+# Keep it in sync with the commands below!
+USAGE = """\
+Usage: step4_multiple_commands.py [OPTIONS] COMMAND [ARGS]...
 
+  A demo CLI with multiple commands
 
-@app.command()
-def greet(name: str):
-    """Say hello to someone."""
-    print(f"Hello, {name}!")
+Commands:
+  greet  Say hello to someone.
+  add    Add two numbers together.
+  info   Show information about this CLI.
 
+Run `python step4_multiple_commands.py COMMAND --help` for a command's arguments.
+"""
+
+
+def _add_kernel(a, b):
+    """The actual math of the add command, kept apart from the CLI code."""
+    return a + b
+
+
+_compiled_add = None
+
+
+def _get_add_kernel():
+    """
+    _add_kernel compiled to machine code by numba, if it's installed.
 
-@app.command()
-def add(a: int, b: int):
-    """Add two numbers together."""
-    result = a + b
-    print(f"{a} + {b} = {result}")
+    Used by `add --jit`. Importing numba and compiling takes far longer
+    than one addition - try it and compare! - so for `add` this is only a
+    pattern to copy: it pays off once a command does heavy number
+    crunching (say, a `fib` command). cache=True saves the compiled code
+    to disk, so later runs skip the compile step.
+    """
+    global _compiled_add
+    if _compiled_add is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _compiled_add = _add_kernel  # No numba? Plain Python is fine
+        else:
+            _compiled_add = njit(cache=True)(_add_kernel)
+    return _compiled_add
 
 
-@app.command()
-def info():
-    """Show information about this CLI."""
-    print("Demo CLI v1.0")
-    print("This is a learning example for Typer")
-    print()
-    print("Available commands:")
-    print("  greet  - Say hello")
-    print("  add    - Add numbers")
-    print("  info   - Show this info")
+def _build_app():
+    """
+    Create the app and its commands.
+
+    Importing Typer (and Click and Rich, which it uses) takes a noticeable
+    moment, so we only do it here - once we know a command will run.
+    """
+    import typer
+
+    # Create the app
+    app = typer.Typer(
+        name="demo",
+        help="A demo CLI with multiple commands",
+        # Turn off extras this small demo doesn't need, so it starts faster:
+        add_completion=False,            # No --install-completion option
+        rich_markup_mode=None,           # Help text is shown as plain text
+        pretty_exceptions_enable=False,  # Normal Python tracebacks
+    )
+
+    @app.command()
+    def greet(name: str):
+        """Say hello to someone."""
+        print(f"Hello, {name}!")
+
+    @app.command()
+    def add(a: int, b: int, jit: bool = False):
+        """Add two numbers together."""
+        # Compiled code uses fixed-size 64-bit integers, which overflow for
+        # huge numbers. Python's own integers don't, so use those instead.
+        if jit and abs(a) < 2**62 and abs(b) < 2**62:
+            result = _get_add_kernel()(a, b)
+        else:
+            result = _add_kernel(a, b)
+        print(f"{a} + {b} = {result}")
+
+    @app.command()
+    def info():
+        """Show information about this CLI."""
+        print("Demo CLI v1.0")
+        print("This is a learning example for Typer")
+        print()
+        print("Available commands:")
+        print("  greet  - Say hello")
+        print("  add    - Add numbers")
+        print("  info   - Show this info")
+
+    return app
 
 
 if __name__ == "__main__":
-    app()
+    if sys.argv[1:] == ["--help"]:
+        print(USAGE, end="")
+    else:
+        _build_app()()
 
 
 # ============================================================
@@ -58,6 +124,7 @@ if __name__ == "__main__":
 #
 # 1. Create an app
 #    app = typer.Typer(name="...", help="...")
+#    (Here it's inside _build_app(), so Typer is only imported when needed)
 #
 # 2. Add commands with decorator
 #    @app.command()
@@ -71,4 +138,8 @@ if __name__ == "__main__":
 #    python script.py COMMAND [ARGS]
 #    python script.py greet Alice
 #    python script.py add 1 2
+#
+# 5. Import only what you need
+#    A plain --help prints USAGE without importing Typer,
+#    so it shows up almost instantly.
 # ============================================================
@@ -12,60 +12,87 @@ Run with:
     python step5_rich_output.py
 """
 
+import sys
+from functools import cache
+
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
 
-# Create a Rich console for output
-console = Console()
+# The table's columns never change, so describe them once: (name, style)
+_TASK_TABLE_COLUMNS = (
+    ("ID", "cyan"),
+    ("Task", "white"),
+    ("Priority", "magenta"),
+    ("Status", "green"),
+)
+
+
+@cache
+def _console():
+    """
+    The Rich console, created the first time it's needed and reused after.
+
+    Creating a Console checks what your terminal can do (colors, width...),
+    so there's no reason to do it more than once.
+    """
+    # Rich is only needed once the demo actually runs, so import it here
+    from rich.console import Console
+
+    return Console()
 
 
 def main():
     """Demonstrate Rich formatting capabilities."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.prompt import Prompt, Confirm
 
-    # === Colored Text ===
-    console.print("\n[bold blue]===  Rich Text Formatting ===[/bold blue]\n")
+    # Get the Rich console for output
+    console = _console()
 
-    console.print("[green]This is green text[/green]")
-    console.print("[bold red]This is bold red[/bold red]")
-    console.print("[italic yellow]This is italic yellow[/italic yellow]")
-    console.print("[underline]This is underlined[/underline]")
-    console.print("[bold magenta]You can [underline]combine[/underline] styles![/bold magenta]")
+    # Draw everything up to the prompts into memory first, then write it
+    # to the screen in one go - instead of one write per console.print()
+    with console.capture() as capture:
+        # === Colored Text ===
+        console.print("\n[bold blue]===  Rich Text Formatting ===[/bold blue]\n")
 
-    # === Panels ===
-    console.print("\n[bold blue]=== Panels ===[/bold blue]\n")
+        console.print("[green]This is green text[/green]")
+        console.print("[bold red]This is bold red[/bold red]")
+        console.print("[italic yellow]This is italic yellow[/italic yellow]")
+        console.print("[underline]This is underlined[/underline]")
+        console.print("[bold magenta]You can [underline]combine[/underline] styles![/bold magenta]")
 
-    console.print(Panel(
-        "This is content inside a panel.\nPanels are great for highlighting information!",
-        title="My Panel",
-        border_style="green"
-    ))
+        # === Panels ===
+        console.print("\n[bold blue]=== Panels ===[/bold blue]\n")
 
-    console.print(Panel(
-        "[red]Error:[/red] Something went wrong!",
-        title="Error",
-        border_style="red"
-    ))
+        console.print(Panel(
+            "This is content inside a panel.\nPanels are great for highlighting information!",
+            title="My Panel",
+            border_style="green"
+        ))
 
-    # === Tables ===
-    console.print("\n[bold blue]=== Tables ===[/bold blue]\n")
+        console.print(Panel(
+            "[red]Error:[/red] Something went wrong!",
+            title="Error",
+            border_style="red"
+        ))
 
-    table = Table(title="Task List")
-    table.add_column("ID", style="cyan")
-    table.add_column("Task", style="white")
-    table.add_column("Priority", style="magenta")
-    table.add_column("Status", style="green")
+        # === Tables ===
+        console.print("\n[bold blue]=== Tables ===[/bold blue]\n")
 
-    table.add_row("1", "Buy groceries", "High", "Pending")
-    table.add_row("2", "Call mom", "Medium", "Done")
-    table.add_row("3", "Fix bug", "Critical", "In Progress")
+        table = Table(title="Task List")
+        for name, style in _TASK_TABLE_COLUMNS:
+            table.add_column(name, style=style)
 
-    console.print(table)
+        table.add_row("1", "Buy groceries", "High", "Pending")
+        table.add_row("2", "Call mom", "Medium", "Done")
+        table.add_row("3", "Fix bug", "Critical", "In Progress")
 
-    # === Interactive Prompts ===
-    console.print("\n[bold blue]=== Interactive Prompts ===[/bold blue]\n")
+        console.print(table)
+
+        # === Interactive Prompts ===
+        console.print("\n[bold blue]=== Interactive Prompts ===[/bold blue]\n")
+
+    sys.stdout.write(capture.get())
 
     name = Prompt.ask("What is your name", default="Anonymous")
     console.print(f"Hello, [bold]{name}[/bold]!")
@@ -115,4 +142,9 @@ if __name__ == "__main__":
 # 5. Prompts
 #    Prompt.ask("Question", default="...")
 #    Confirm.ask("Yes/no question?")
+#
+# 6. Capturing output
+#    with console.capture() as capture:
+#        console.print(...)
+#    capture.get() → everything printed, as one string
 # ============================================================
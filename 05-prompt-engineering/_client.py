@@ -0,0 +1,61 @@
+"""
+One shared Anthropic client for the step files in this module.
+
+The anthropic package is big - it brings httpx and pydantic along with
+it - so we only import it the first time a client is actually needed,
+not as soon as the script starts.
+
+Every request goes through one pool of HTTP connections. After the first
+request, the rest reuse its already-open connection instead of each
+setting up a new one (which takes a few round trips to the server).
+
+Usage:
+    from _client import get_client
+    client = get_client()
+
+    # Or, for async code (see step5_iteration.py):
+    from _client import get_async_client
+    client = get_async_client()
+"""
+
+import importlib.util
+
+_client = None
+_async_client = None
+
+
+def _http_options():
+    """Connection pool settings shared by the sync and async clients."""
+    import httpx  # Installed together with anthropic
+
+    return {
+        # HTTP/2 sends many requests over one connection at the same time.
+        # It needs the optional "h2" package (pip install "httpx[http2]").
+        "http2": importlib.util.find_spec("h2") is not None,
+        "timeout": 60.0,
+        # Keep up to 10 connections, and keep idle ones open for a minute
+        "limits": httpx.Limits(
+            max_keepalive_connections=10, max_connections=10, keepalive_expiry=60
+        ),
+    }
+
+
+def get_client():
+    """Return the shared client, creating it the first time it's needed."""
+    global _client
+    if _client is None:
+        from anthropic import Anthropic, DefaultHttpxClient
+
+        # Automatically uses ANTHROPIC_API_KEY environment variable
+        _client = Anthropic(http_client=DefaultHttpxClient(**_http_options()))
+    return _client
+
+
+def get_async_client():
+    """Same as get_client(), but for async code (await client.messages...)."""
+    global _async_client
+    if _async_client is None:
+        from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+        _async_client = AsyncAnthropic(http_client=DefaultAsyncHttpxClient(**_http_options()))
+    return _async_client
@@ -11,16 +11,17 @@ Note: Requires ANTHROPIC_API_KEY environment variable
 """
 
 import os
-from anthropic import Anthropic
-
-# Create the client
-client = Anthropic()
+from _client import get_client
 
 
 def get_task_breakdown(task: str) -> str:
     """Ask Claude to break down a task."""
 
-    response = client.messages.create(
+    # The client (and the anthropic package) is only loaded on first use
+    client = get_client()
+    # stream() hands us the reply piece by piece as Claude writes it.
+    # Here we just join the pieces into one string at the end.
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=500,
         messages=[
@@ -29,9 +30,10 @@ def get_task_breakdown(task: str) -> str:
                 "content": f"Break down this task into steps: {task}"
             }
         ]
-    )
+    ) as stream:
+        text = "".join(stream.text_stream)
 
-    return response.content[0].text
+    return text
 
 
 def main():
@@ -10,10 +10,15 @@ Note: Requires ANTHROPIC_API_KEY environment variable
 """
 
 import os
-import json
-from anthropic import Anthropic
+import sys
+from _client import get_client
 
-client = Anthropic()
+# orjson parses JSON several times faster (pip install orjson).
+# Without it, Python's built-in json module does the same job.
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 
 def get_task_breakdown(task: str) -> dict:
@@ -33,22 +38,21 @@ Respond with ONLY valid JSON in this exact format:
 
 No other text, just the JSON."""
 
-    response = client.messages.create(
+    client = get_client()
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=1000,
         messages=[
             {"role": "user", "content": prompt}
         ]
-    )
-
-    # Get the text response
-    text = response.content[0].text
+    ) as stream:
+        text = "".join(stream.text_stream)
 
     # Parse it as JSON
     try:
-        data = json.loads(text)
+        data = loads(text)
         return data
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json and orjson both raise a ValueError
         print(f"Failed to parse JSON: {e}")
         print(f"Raw response: {text}")
         return {}
@@ -66,9 +70,13 @@ def main():
     if result:
         print(f"\nParsed {len(result.get('steps', []))} steps:\n")
 
+        # Build every line first, then print them all in one write
+        lines = []
         for step in result.get("steps", []):
-            print(f"  {step['number']}. {step['title']}")
-            print(f"     {step['description']}\n")
+            lines.append(f"  {step['number']}. {step['title']}")
+            lines.append(f"     {step['description']}\n")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print("-" * 50)
         print("\nNOW WE CAN:")
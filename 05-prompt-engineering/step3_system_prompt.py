@@ -15,10 +15,20 @@ Note: Requires ANTHROPIC_API_KEY environment variable
 """
 
 import os
-import json
-from anthropic import Anthropic
+import sys
+import re
+from functools import lru_cache
+from _client import get_client
 
-client = Anthropic()
+# Faster JSON parsing if orjson is installed (see step2)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Finds the {...} part of a reply that has extra text around it.
+# Compiled once here instead of every time we need it.
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
 
 # The system prompt defines HOW Claude should behave
 SYSTEM_PROMPT = """You are a task planning assistant. Your job is to break down tasks into clear, actionable steps.
@@ -46,10 +56,18 @@ IMPORTANT RULES:
 """
 
 
-def get_task_breakdown(task: str) -> dict:
-    """Ask Claude to break down a task using system prompt."""
+@lru_cache(maxsize=1024)
+def _cached_breakdown(task: str) -> str:
+    """
+    Ask Claude to break down a task, and return the raw reply text.
 
-    response = client.messages.create(
+    The same task gets the reply we already have instead of a new API
+    call (lru_cache remembers the last 1024 tasks). Claude's answers vary
+    from call to call - for a fresh one, use _cached_breakdown.__wrapped__(task)
+    or empty the cache with _cached_breakdown.cache_clear().
+    """
+    client = get_client()
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=1000,
         system=SYSTEM_PROMPT,  # <-- System prompt goes here!
@@ -57,18 +75,21 @@ def get_task_breakdown(task: str) -> dict:
             # Now the user message can be simple
             {"role": "user", "content": task}
         ]
-    )
+    ) as stream:
+        return "".join(stream.text_stream)
 
-    text = response.content[0].text
+
+def get_task_breakdown(task: str) -> dict:
+    """Ask Claude to break down a task using system prompt."""
+    text = _cached_breakdown(task)
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return loads(text)
+    except ValueError:
         # Try to extract JSON if there's extra text
-        import re
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(text)
         if json_match:
-            return json.loads(json_match.group())
+            return loads(json_match.group())
         return {}
 
 
@@ -86,10 +107,13 @@ def main():
         print(f"📊 Difficulty: {result.get('difficulty', 'Unknown')}")
         print(f"\n📝 Steps ({len(result.get('steps', []))} total):\n")
 
+        lines = []
         for step in result.get("steps", []):
-            print(f"  {step['number']}. {step['title']}")
-            print(f"     {step['description']}")
-            print(f"     ⏰ {step.get('time', 'N/A')}\n")
+            lines.append(f"  {step['number']}. {step['title']}")
+            lines.append(f"     {step['description']}")
+            lines.append(f"     ⏰ {step.get('time', 'N/A')}\n")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -117,4 +141,7 @@ if __name__ == "__main__":
 #        system=SYSTEM_PROMPT,  # <-- System prompt
 #        messages=[...]         # <-- User messages
 #    )
+#
+#    (This file uses client.messages.stream(...), which takes the
+#    same arguments - the reply just arrives in pieces.)
 # ============================================================
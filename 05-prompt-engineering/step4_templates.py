@@ -15,10 +15,19 @@ Note: Requires ANTHROPIC_API_KEY environment variable
 """
 
 import os
-import json
-from anthropic import Anthropic
+import sys
+import re
+from functools import lru_cache
+from _client import get_client
 
-client = Anthropic()
+# Faster JSON parsing if orjson is installed (see step2)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Pulls the {...} out of a reply with extra text (compiled once - see step3)
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
 
 
 # Template with placeholders
@@ -40,6 +49,9 @@ Always respond with valid JSON in this format:
 """
 
 
+# Same arguments → same prompt, so remember the results instead of
+# filling in the template again every time the same persona is used
+@lru_cache(maxsize=256)
 def create_system_prompt(
     role: str = "helpful",
     domain: str = "general",
@@ -55,27 +67,36 @@ def create_system_prompt(
     )
 
 
-def get_task_breakdown(task: str, system_prompt: str) -> dict:
-    """Get task breakdown with custom system prompt."""
+@lru_cache(maxsize=1024)
+def _cached_breakdown(task: str, system_prompt: str) -> str:
+    """
+    The raw reply text for this task and prompt, reusing earlier replies.
 
-    response = client.messages.create(
+    Works like step3's version. Bypass the cache with
+    _cached_breakdown.__wrapped__(task, system_prompt) to get a fresh reply.
+    """
+    client = get_client()
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=1000,
         system=system_prompt,
         messages=[
             {"role": "user", "content": task}
         ]
-    )
+    ) as stream:
+        return "".join(stream.text_stream)
 
-    text = response.content[0].text
+
+def get_task_breakdown(task: str, system_prompt: str) -> dict:
+    """Get task breakdown with custom system prompt."""
+    text = _cached_breakdown(task, system_prompt)
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        import re
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
+        return loads(text)
+    except ValueError:
+        json_match = _JSON_BLOCK_RE.search(text)
         if json_match:
-            return json.loads(json_match.group())
+            return loads(json_match.group())
         return {}
 
 
@@ -89,8 +110,9 @@ def print_result(result: dict):
     print(f"📁 Category: {result.get('category', 'Unknown')}")
     print(f"\n📝 Steps:")
 
-    for step in result.get("steps", []):
-        print(f"  {step['number']}. {step['title']}")
+    lines = [f"  {step['number']}. {step['title']}" for step in result.get("steps", [])]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if result.get("tips"):
         print(f"\n💡 Tips:")
@@ -165,4 +187,16 @@ if __name__ == "__main__":
 #    - Different domains (cooking, fitness, coding)
 #    - Different output formats (brief, detailed)
 #    - User-selected preferences
+#
+# 5. @lru_cache
+#    Remembers what a function returned for each set of arguments.
+#    Calling create_system_prompt() again with the same persona
+#    is just a lookup - no template filling.
+#
+# 6. Why .format() and not string.Template or f-strings?
+#    string.Template ($name placeholders) is actually slower than
+#    .format() for a template like this one. An f-string is faster,
+#    but it fills itself in immediately - you can't keep it around
+#    as a template. With @lru_cache, .format() only runs once per
+#    persona anyway.
 # ============================================================
@@ -12,15 +12,24 @@ This file shows common issues and how to fix them.
 
 Run with:
     python step5_iteration.py
+    python step5_iteration.py --batch   # Half price, but can take minutes
 
 Note: Requires ANTHROPIC_API_KEY environment variable
 """
 
+import argparse
+import asyncio
 import os
-import json
-from anthropic import Anthropic
+from _client import get_async_client
 
-client = Anthropic()
+# Faster JSON parsing if orjson is installed (see step2)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+MODEL = "claude-sonnet-4-20250514"
+POLL_SECONDS = 10  # How often --batch checks whether the batch is done
 
 
 # ============================================================
@@ -77,24 +86,79 @@ Rules:
 """
 
 
-def test_prompt(prompt_name: str, system_prompt: str, task: str):
-    """Test a prompt and show results."""
+async def run_prompt(system_prompt: str, task: str) -> str:
+    """Send one prompt to Claude and return the reply text."""
+    client = get_async_client()
+    pieces = []
+    async with client.messages.stream(
+        model=MODEL,
+        max_tokens=1000,
+        system=system_prompt,
+        messages=[{"role": "user", "content": task}]
+    ) as stream:
+        async for text in stream.text_stream:
+            pieces.append(text)
+            print(".", end="", flush=True)  # A dot per piece, so you can see progress
+
+    return "".join(pieces)
+
+
+async def run_batch(
+    system_prompts: list[str], task: str
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Send every prompt in ONE request with the Message Batches API.
+
+    Batches cost half as much, but Claude works on them in the background,
+    so we have to check back until they're done. Prompt number i gets the
+    custom_id f"prompt-{i}". Returns two dicts: custom_id → reply text for
+    the requests that succeeded, and custom_id → what went wrong
+    ("errored", "expired"...) for the ones that didn't.
+    """
+    client = get_async_client()
+    batch = await client.messages.batches.create(requests=[
+        {
+            "custom_id": f"prompt-{i}",
+            "params": {
+                "model": MODEL,
+                "max_tokens": 1000,
+                "system": system_prompt,
+                "messages": [{"role": "user", "content": task}],
+            },
+        }
+        for i, system_prompt in enumerate(system_prompts)
+    ])
+
+    while batch.processing_status != "ended":
+        await asyncio.sleep(POLL_SECONDS)
+        print(".", end="", flush=True)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    # Results arrive in any order - custom_id tells us which is which
+    replies = {}
+    failures = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            replies[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            failures[entry.custom_id] = entry.result.type
+    return replies, failures
+
+
+def print_header(prompt_name: str):
+    """The banner above each prompt version's results."""
     print(f"\n{'='*60}")
     print(f"Testing: {prompt_name}")
     print(f"{'='*60}")
 
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=1000,
-        system=system_prompt,
-        messages=[{"role": "user", "content": task}]
-    )
 
-    text = response.content[0].text
+def check_reply(prompt_name: str, text: str):
+    """Show how well a prompt's reply matches what we asked for."""
+    print_header(prompt_name)
 
     # Try to parse as JSON
     try:
-        data = json.loads(text)
+        data = loads(text)
         print("✅ Valid JSON!")
         print(f"   Steps: {len(data.get('steps', []))}")
 
@@ -108,23 +172,49 @@ def test_prompt(prompt_name: str, system_prompt: str, task: str):
             print(f"   Has title field: {'✅' if has_title else '❌'}")
             print(f"   Has description field: {'✅' if has_desc else '❌'}")
 
-    except json.JSONDecodeError:
+    except ValueError:
         print("❌ Not valid JSON")
         print(f"   Response preview: {text[:200]}...")
 
 
-def main():
+async def main(use_batch: bool = False):
     task = "Learn to cook Italian food"
 
     print("\n" + "🔬 PROMPT ITERATION EXPERIMENT ".center(60, "="))
     print("\nWe'll test the same task with different prompt versions")
     print(f"Task: '{task}'")
 
-    # Test each version
-    test_prompt("V1 - Too Vague", PROMPT_V1, task)
-    test_prompt("V2 - No Format Spec", PROMPT_V2, task)
-    test_prompt("V3 - Basic Format", PROMPT_V3, task)
-    test_prompt("V4 - Production Ready", PROMPT_V4, task)
+    versions = [
+        ("V1 - Too Vague", PROMPT_V1),
+        ("V2 - No Format Spec", PROMPT_V2),
+        ("V3 - Basic Format", PROMPT_V3),
+        ("V4 - Production Ready", PROMPT_V4),
+    ]
+
+    # The 4 tests don't depend on each other, so send them all at once.
+    # gather() waits until every reply is in - the total wait is the
+    # slowest request, not all four added together.
+    print("\nWaiting for replies", end="")
+    failures = {}
+    if use_batch:
+        by_id, failures = await run_batch([system_prompt for _, system_prompt in versions], task)
+        # None = no reply for that version (its request failed)
+        replies = [by_id.get(f"prompt-{i}") for i in range(len(versions))]
+    else:
+        replies = await asyncio.gather(
+            *(run_prompt(system_prompt, task) for _, system_prompt in versions)
+        )
+    print()
+
+    # Replies come back in the same order we sent them
+    for i, ((prompt_name, _), text) in enumerate(zip(versions, replies)):
+        if text is None:
+            # Not the prompt's fault - there's no reply to judge
+            problem = failures.get(f"prompt-{i}", "missing")
+            print_header(prompt_name)
+            print(f"⚠️  Request {problem} - no reply to check")
+        else:
+            check_reply(prompt_name, text)
 
     print("\n" + "="*60)
     print("LESSONS LEARNED")
@@ -156,7 +246,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Compare prompt versions on one task.")
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Send all prompts as one Message Batch (half price, slower)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(use_batch=args.batch))
 
 
 # ============================================================
@@ -189,4 +285,9 @@ if __name__ == "__main__":
 #    Try many different inputs
 #    Look for failure modes
 #    Refine based on real results
+#
+# 7. Spend Your Effort on the Prompt, Not the Plumbing
+#    Turning PROMPT_V4 into the bytes of a request takes a few
+#    microseconds; Claude's reply takes seconds. Shorter prompts
+#    (fewer tokens) and fewer requests are what make things faster.
 # ============================================================